@@ -0,0 +1,74 @@
+import os
+from unittest import mock
+
+import agate
+import boto3
+import pytest
+from moto import mock_athena, mock_glue, mock_s3, mock_sts
+
+from .constants import AWS_REGION
+from .fixtures import seed_data
+from .utils import MockAWSService
+
+
+@pytest.fixture(scope="session", autouse=True)
+def no_sleep():
+    """Unit tests never talk to a real backend, so retry and polling back-offs are pure wall time."""
+    with mock.patch("time.sleep"):
+        yield
+
+
+@pytest.fixture(scope="session", autouse=True)
+def aws_credentials():
+    """Mocked AWS Credentials for moto."""
+    with mock.patch.dict(
+        os.environ,
+        {
+            "AWS_ACCESS_KEY_ID": "testing",
+            "AWS_SECRET_ACCESS_KEY": "testing",
+            "AWS_SECURITY_TOKEN": "testing",
+            "AWS_SESSION_TOKEN": "testing",
+            "AWS_DEFAULT_REGION": AWS_REGION,
+        },
+    ):
+        yield
+
+
+@pytest.fixture(scope="class")
+def athena_env():
+    """Mocked AWS services, started once per test class with the default data catalog and database in place."""
+    with mock_athena() as athena, mock_glue() as glue, mock_s3() as s3, mock_sts() as sts:
+        mock_aws_service = MockAWSService()
+        mock_aws_service.create_data_catalog()
+        mock_aws_service.create_database()
+        yield athena, glue, s3, sts
+
+
+@pytest.fixture
+def reset_athena_env(athena_env):
+    """Wipe the Athena, S3 and STS data created by a test while keeping the class mocks active.
+
+    Glue is left alone so the shared database survives, tests drop their own Glue tables.
+    """
+    yield
+    athena, _, s3, sts = athena_env
+    for mocked_service in (athena, s3, sts):
+        for backend in mocked_service.backends.values():
+            backend.reset()
+    # moto has no way to drop a single data catalog, so put back the default one the reset took away
+    MockAWSService().create_data_catalog()
+
+
+@pytest.fixture(scope="class")
+def glue_client(athena_env):
+    return boto3.client("glue", region_name=AWS_REGION)
+
+
+@pytest.fixture(scope="class")
+def s3_client(athena_env):
+    return boto3.client("s3", region_name=AWS_REGION)
+
+
+@pytest.fixture(scope="module")
+def seed_agate_table():
+    return agate.Table.from_object(seed_data)
@@ -1,12 +1,15 @@
+import dataclasses
 import decimal
-import os
+import re
+from types import SimpleNamespace
 from unittest import mock
 from unittest.mock import patch
 
 import agate
 import boto3
 import pytest
-from moto import mock_athena, mock_glue, mock_s3, mock_sts
+from botocore.exceptions import ClientError
+from botocore.stub import Stubber
 from moto.core import DEFAULT_ACCOUNT_ID
 
 from dbt.adapters.athena import AthenaAdapter
@@ -30,7 +33,6 @@ from .constants import (
     S3_STAGING_DIR,
     SHARED_DATA_CATALOG_NAME,
 )
-from .fixtures import seed_data
 from .utils import (
     MockAWSService,
     TestAdapterConversions,
@@ -38,438 +40,260 @@ from .utils import (
     inject_adapter,
 )
 
+_BASE_NODE_CONFIG = NodeConfig.from_dict(
+    {
+        "enabled": True,
+        "materialized": "table",
+        "persist_docs": {},
+        "post-hook": [],
+        "pre-hook": [],
+        "vars": {},
+        "meta": {},
+        "quoting": {},
+        "column_types": {},
+        "tags": [],
+    }
+)
+_EMPTY_FILEHASH = FileHash.from_contents("")
 
-class TestAthenaAdapter:
-    mock_aws_service = MockAWSService()
 
-    def setup_method(self, _):
-        project_cfg = {
-            "name": "X",
-            "version": "0.1",
-            "profile": "test",
-            "project-root": "/tmp/dbt/does-not-exist",
-            "config-version": 2,
-        }
-        profile_cfg = {
-            "outputs": {
-                "test": {
-                    "type": "athena",
-                    "s3_staging_dir": S3_STAGING_DIR,
-                    "region_name": AWS_REGION,
-                    "database": DATA_CATALOG_NAME,
-                    "work_group": ATHENA_WORKGROUP,
-                    "schema": DATABASE_NAME,
-                }
-            },
-            "target": "test",
-        }
+def _node_cfg(owner):
+    return dataclasses.replace(_BASE_NODE_CONFIG, meta={"owner": owner})
+
+
+_NODE_SPECS = (
+    ("model1", "awsdatacatalog", "foo", "bar", "model.root.model1", "data-engineers"),
+    ("model2", "awsdatacatalog", "quux", "bar", "model.root.model2", "data-analysts"),
+    ("model2", "awsdatacatalog", "baz", "qux", "model.root.model3", "data-engineers"),
+    ("model4", SHARED_DATA_CATALOG_NAME, "foo", "bar", "model.root.model4", "data-engineers"),
+)
+
+
+def _build_node(name, database, schema, alias, unique_id, owner):
+    path = f"{unique_id.rsplit('.', 1)[-1]}.sql"
+    return CompiledNode(
+        name=name,
+        database=database,
+        schema=schema,
+        resource_type=NodeType.Model,
+        unique_id=unique_id,
+        alias=alias,
+        fqn=["root", name],
+        package_name="root",
+        refs=[],
+        sources=[],
+        depends_on=DependsOn(),
+        config=_node_cfg(owner),
+        tags=[],
+        path=path,
+        original_file_path=path,
+        compiled=True,
+        extra_ctes_injected=False,
+        extra_ctes=[],
+        checksum=_EMPTY_FILEHASH,
+        raw_code="select * from source_table",
+        language="",
+    )
+
 
-        self.config = config_from_parts_or_dicts(project_cfg, profile_cfg)
-        self._adapter = None
-        self.mock_manifest = mock.MagicMock()
-        self.mock_manifest.get_used_schemas.return_value = {
-            ("awsdatacatalog", "foo"),
-            ("awsdatacatalog", "quux"),
-            ("awsdatacatalog", "baz"),
-            (SHARED_DATA_CATALOG_NAME, "foo"),
+_NODES = {spec[4]: _build_node(*spec) for spec in _NODE_SPECS}
+_USED_SCHEMAS = {
+    ("awsdatacatalog", "foo"),
+    ("awsdatacatalog", "quux"),
+    ("awsdatacatalog", "baz"),
+    (SHARED_DATA_CATALOG_NAME, "foo"),
+}
+_MANIFEST = SimpleNamespace(
+    nodes=_NODES,
+    sources={},
+    get_used_schemas=lambda: _USED_SCHEMAS,
+)
+_CATALOG_COLUMN_NAMES = (
+    "table_database",
+    "table_schema",
+    "table_name",
+    "table_type",
+    "table_comment",
+    "column_name",
+    "column_index",
+    "column_type",
+    "column_comment",
+    "table_owner",
+)
+_ONE_CATALOG_ROWS = frozenset(
+    {
+        ("awsdatacatalog", "foo", "bar", "table", None, "id", 0, "string", None, "data-engineers"),
+        ("awsdatacatalog", "foo", "bar", "table", None, "country", 1, "string", None, "data-engineers"),
+        ("awsdatacatalog", "foo", "bar", "table", None, "dt", 2, "date", None, "data-engineers"),
+        ("awsdatacatalog", "quux", "bar", "table", None, "id", 0, "string", None, "data-analysts"),
+        ("awsdatacatalog", "quux", "bar", "table", None, "country", 1, "string", None, "data-analysts"),
+        ("awsdatacatalog", "quux", "bar", "table", None, "dt", 2, "date", None, "data-analysts"),
+        ("awsdatacatalog", "baz", "qux", "table", None, "id", 0, "string", None, "data-engineers"),
+        ("awsdatacatalog", "baz", "qux", "table", None, "country", 1, "string", None, "data-engineers"),
+    }
+)
+_SHARED_CATALOG_ROWS = frozenset(
+    {
+        (SHARED_DATA_CATALOG_NAME, "foo", "bar", "table", None, "id", 0, "string", None, "data-engineers"),
+        (SHARED_DATA_CATALOG_NAME, "foo", "bar", "table", None, "country", 1, "string", None, "data-engineers"),
+        (SHARED_DATA_CATALOG_NAME, "foo", "bar", "table", None, "dt", 2, "date", None, "data-engineers"),
+    }
+)
+_CLEAN_UP_PARTITIONS_LOGS = (
+    "Deleting table data: path="
+    "'s3://test-dbt-athena/tables/table/dt=2022-01-01', "
+    "bucket='test-dbt-athena', "
+    "prefix='tables/table/dt=2022-01-01/'",
+    "Deleting table data: path="
+    "'s3://test-dbt-athena/tables/table/dt=2022-01-02', "
+    "bucket='test-dbt-athena', "
+    "prefix='tables/table/dt=2022-01-02/'",
+)
+_CLEAN_UP_PARTITIONS_LOGS_RE = re.compile("|".join(re.escape(log) for log in _CLEAN_UP_PARTITIONS_LOGS))
+PERSIST_DOCS_PAYLOAD = {
+    "description": """
+                        A table with str, 123, &^% \" and '
+
+                          and an other paragraph.
+                    """,
+    "columns": {
+        "id": {
+            "description": """
+                        A column with str, 123, &^% \" and '
+
+                          and an other paragraph.
+                    """,
         }
-        self.mock_manifest.nodes = {
-            "model.root.model1": CompiledNode(
-                name="model1",
-                database="awsdatacatalog",
-                schema="foo",
-                resource_type=NodeType.Model,
-                unique_id="model.root.model1",
-                alias="bar",
-                fqn=["root", "model1"],
-                package_name="root",
-                refs=[],
-                sources=[],
-                depends_on=DependsOn(),
-                config=NodeConfig.from_dict(
-                    {
-                        "enabled": True,
-                        "materialized": "table",
-                        "persist_docs": {},
-                        "post-hook": [],
-                        "pre-hook": [],
-                        "vars": {},
-                        "meta": {"owner": "data-engineers"},
-                        "quoting": {},
-                        "column_types": {},
-                        "tags": [],
-                    }
-                ),
-                tags=[],
-                path="model1.sql",
-                original_file_path="model1.sql",
-                compiled=True,
-                extra_ctes_injected=False,
-                extra_ctes=[],
-                checksum=FileHash.from_contents(""),
-                raw_code="select * from source_table",
-                language="",
-            ),
-            "model.root.model2": CompiledNode(
-                name="model2",
-                database="awsdatacatalog",
-                schema="quux",
-                resource_type=NodeType.Model,
-                unique_id="model.root.model2",
-                alias="bar",
-                fqn=["root", "model2"],
-                package_name="root",
-                refs=[],
-                sources=[],
-                depends_on=DependsOn(),
-                config=NodeConfig.from_dict(
-                    {
-                        "enabled": True,
-                        "materialized": "table",
-                        "persist_docs": {},
-                        "post-hook": [],
-                        "pre-hook": [],
-                        "vars": {},
-                        "meta": {"owner": "data-analysts"},
-                        "quoting": {},
-                        "column_types": {},
-                        "tags": [],
-                    }
-                ),
-                tags=[],
-                path="model2.sql",
-                original_file_path="model2.sql",
-                compiled=True,
-                extra_ctes_injected=False,
-                extra_ctes=[],
-                checksum=FileHash.from_contents(""),
-                raw_code="select * from source_table",
-                language="",
-            ),
-            "model.root.model3": CompiledNode(
-                name="model2",
-                database="awsdatacatalog",
-                schema="baz",
-                resource_type=NodeType.Model,
-                unique_id="model.root.model3",
-                alias="qux",
-                fqn=["root", "model2"],
-                package_name="root",
-                refs=[],
-                sources=[],
-                depends_on=DependsOn(),
-                config=NodeConfig.from_dict(
-                    {
-                        "enabled": True,
-                        "materialized": "table",
-                        "persist_docs": {},
-                        "post-hook": [],
-                        "pre-hook": [],
-                        "vars": {},
-                        "meta": {"owner": "data-engineers"},
-                        "quoting": {},
-                        "column_types": {},
-                        "tags": [],
-                    }
-                ),
-                tags=[],
-                path="model3.sql",
-                original_file_path="model3.sql",
-                compiled=True,
-                extra_ctes_injected=False,
-                extra_ctes=[],
-                checksum=FileHash.from_contents(""),
-                raw_code="select * from source_table",
-                language="",
-            ),
-            "model.root.model4": CompiledNode(
-                name="model4",
-                database=SHARED_DATA_CATALOG_NAME,
-                schema="foo",
-                resource_type=NodeType.Model,
-                unique_id="model.root.model4",
-                alias="bar",
-                fqn=["root", "model4"],
-                package_name="root",
-                refs=[],
-                sources=[],
-                depends_on=DependsOn(),
-                config=NodeConfig.from_dict(
-                    {
-                        "enabled": True,
-                        "materialized": "table",
-                        "persist_docs": {},
-                        "post-hook": [],
-                        "pre-hook": [],
-                        "vars": {},
-                        "meta": {"owner": "data-engineers"},
-                        "quoting": {},
-                        "column_types": {},
-                        "tags": [],
-                    }
-                ),
-                tags=[],
-                path="model4.sql",
-                original_file_path="model4.sql",
-                compiled=True,
-                extra_ctes_injected=False,
-                extra_ctes=[],
-                checksum=FileHash.from_contents(""),
-                raw_code="select * from source_table",
-                language="",
-            ),
+    },
+}
+EXPECTED_TBL_NAME_COLUMNS = (
+    AthenaColumn(column="id", dtype="string", table_type=TableType.TABLE),
+    AthenaColumn(column="country", dtype="string", table_type=TableType.TABLE),
+    AthenaColumn(column="dt", dtype="date", table_type=TableType.TABLE),
+)
+FILTER_TABLE_COLUMN_NAMES = ("table_name", "table_database", "table_schema", "something")
+FILTER_TABLE_ROWS = (
+    ("foo", "a", "b", "1234"),  # include
+    ("foo", "a", "1234", "1234"),  # include, w/ table schema as str
+    ("foo", "c", "B", "1234"),  # skip
+    ("1234", "A", "B", "1234"),  # include, w/ table name as str
+)
+_PROJECT_CFG = {
+    "name": "X",
+    "version": "0.1",
+    "profile": "test",
+    "project-root": "/tmp/dbt/does-not-exist",
+    "config-version": 2,
+}
+_PROFILE_CFG = {
+    "outputs": {
+        "test": {
+            "type": "athena",
+            "s3_staging_dir": S3_STAGING_DIR,
+            "region_name": AWS_REGION,
+            "database": DATA_CATALOG_NAME,
+            "work_group": ATHENA_WORKGROUP,
+            "schema": DATABASE_NAME,
         }
+    },
+    "target": "test",
+}
 
-    @property
-    def adapter(self):
-        if self._adapter is None:
-            self._adapter = AthenaAdapter(self.config)
-            inject_adapter(self._adapter, AthenaPlugin)
-        return self._adapter
 
-    @mock.patch("dbt.adapters.athena.connections.AthenaConnection")
-    def test_acquire_connection_validations(self, connection_cls):
-        try:
-            connection = self.adapter.acquire_connection("dummy")
-        except DbtRuntimeError as e:
-            pytest.fail(f"got ValidationException: {e}")
-        except BaseException as e:
-            pytest.fail(f"acquiring connection failed with unknown exception: {e}")
+def _count_partitions(glue_client, table_name):
+    pages = glue_client.get_paginator("get_partitions").paginate(
+        DatabaseName=DATABASE_NAME, TableName=table_name, PaginationConfig={"PageSize": 1000}
+    )
+    return sum(len(page["Partitions"]) for page in pages)
 
-        connection_cls.assert_not_called()
-        connection.handle
-        connection_cls.assert_called_once()
-        _, arguments = connection_cls.call_args_list[0]
-        assert arguments["s3_staging_dir"] == "s3://my-bucket/test-dbt/"
-        assert arguments["endpoint_url"] is None
-        assert arguments["schema_name"] == "test_dbt_athena"
-        assert arguments["work_group"] == "dbt-athena-adapter"
-        assert arguments["cursor_class"] == AthenaCursor
-        assert isinstance(arguments["formatter"], AthenaParameterFormatter)
-        assert arguments["poll_interval"] == 1.0
-        assert arguments["retry_config"].attempt == 5
-        assert arguments["retry_config"].exceptions == (
-            "ThrottlingException",
-            "TooManyRequestsException",
-            "InternalServerException",
-        )
 
-    @mock.patch("dbt.adapters.athena.connections.AthenaConnection")
-    def test_acquire_connection(self, connection_cls):
-        connection = self.adapter.acquire_connection("dummy")
+@pytest.fixture
+def mock_manifest():
+    return _MANIFEST
 
-        connection_cls.assert_not_called()
-        connection.handle
-        assert connection.state == ConnectionState.OPEN
-        assert connection.handle is not None
-        connection_cls.assert_called_once()
 
-    @mock.patch("dbt.adapters.athena.connections.AthenaConnection")
-    def test_acquire_connection_exc(self, connection_cls, dbt_error_caplog):
-        connection_cls.side_effect = lambda **_: (_ for _ in ()).throw(Exception("foobar"))
-        connection = self.adapter.acquire_connection("dummy")
-        conn_res = None
-        with pytest.raises(ConnectionError) as exc:
-            conn_res = connection.handle
+class TestAthenaAdapter:
+    pytestmark = pytest.mark.usefixtures("athena_env", "reset_athena_env")
+    mock_aws_service = MockAWSService()
 
-        assert conn_res is None
-        assert connection.state == ConnectionState.FAIL
-        assert exc.value.__str__() == "foobar"
-        assert "Got an error when attempting to open a Athena connection due to foobar" in dbt_error_caplog.getvalue()
+    @pytest.fixture(scope="class", autouse=True)
+    def _adapter(self, request):
+        request.cls.config = config_from_parts_or_dicts(_PROJECT_CFG, _PROFILE_CFG)
+        request.cls.adapter = AthenaAdapter(request.cls.config)
+        inject_adapter(request.cls.adapter, AthenaPlugin)
 
-    @pytest.mark.parametrize(
-        ("s3_data_dir", "s3_data_naming", "s3_path_table_part", "external_location", "is_temporary_table", "expected"),
-        (
-            pytest.param(None, "table", None, None, False, "s3://my-bucket/test-dbt/tables/table", id="table naming"),
-            pytest.param(None, "uuid", None, None, False, "s3://my-bucket/test-dbt/tables/uuid", id="uuid naming"),
-            pytest.param(
-                None,
-                "table_unique",
-                None,
-                None,
-                False,
-                "s3://my-bucket/test-dbt/tables/table/uuid",
-                id="table_unique naming",
-            ),
-            pytest.param(
-                None,
-                "schema_table",
-                None,
-                None,
-                False,
-                "s3://my-bucket/test-dbt/tables/schema/table",
-                id="schema_table naming",
-            ),
-            pytest.param(
-                None,
-                "schema_table_unique",
-                None,
-                None,
-                False,
-                "s3://my-bucket/test-dbt/tables/schema/table/uuid",
-                id="schema_table_unique naming",
-            ),
-            pytest.param(
-                "s3://my-data-bucket/",
-                "schema_table_unique",
-                None,
-                None,
-                False,
-                "s3://my-data-bucket/schema/table/uuid",
-                id="data_dir set",
-            ),
-            pytest.param(
-                "s3://my-data-bucket/",
-                "schema_table_unique",
-                None,
-                "s3://path/to/external/",
-                False,
-                "s3://path/to/external",
-                id="external_location set and not temporary",
-            ),
-            pytest.param(
-                "s3://my-data-bucket/",
-                "schema_table_unique",
-                None,
-                "s3://path/to/external/",
-                True,
-                "s3://my-data-bucket/schema/table/uuid",
-                id="external_location set and temporary",
-            ),
-            pytest.param(
-                None,
-                "schema_table_unique",
-                "other_table",
-                None,
-                False,
-                "s3://my-bucket/test-dbt/tables/schema/other_table/uuid",
-                id="s3_path_table_part set",
-            ),
-        ),
-    )
-    @patch("dbt.adapters.athena.impl.uuid4", return_value="uuid")
-    def test_s3_table_location(
-        self, _, s3_data_dir, s3_data_naming, external_location, s3_path_table_part, is_temporary_table, expected
-    ):
+    @pytest.fixture(autouse=True)
+    def _conn(self):
         self.adapter.acquire_connection("dummy")
-        assert expected == self.adapter.s3_table_location(
-            s3_data_dir, s3_data_naming, "schema", "table", s3_path_table_part, external_location, is_temporary_table
-        )
+        yield
+        # the adapter is shared by the whole class, drop the connections and relations of the test
+        self.adapter.connections.cleanup_all()
+        self.adapter.cache.clear()
 
-    def test_s3_table_location_exc(self):
-        self.adapter.acquire_connection("dummy")
-        with pytest.raises(ValueError) as exc:
-            self.adapter.s3_table_location(None, "other", "schema", "table")
-        assert exc.value.__str__() == "Unknown value for s3_data_naming: other"
+    @pytest.fixture(autouse=True)
+    def _drop_glue_objects(self):
+        yield
+        self.mock_aws_service.drop_created_glue_objects()
+
+    @pytest.fixture
+    def make_relation(self):
+        def _make_relation(identifier="tbl_name"):
+            return self.adapter.Relation.create(database=DATA_CATALOG_NAME, schema=DATABASE_NAME, identifier=identifier)
+
+        return _make_relation
+
+    @pytest.fixture
+    def mock_glue_client(self):
+        with mock.patch.object(self.adapter.connections, "get_thread_connection") as get_thread_connection:
+            glue_client = get_thread_connection.return_value.handle.session.client.return_value
+            # modeled Glue errors subclass ClientError, which is all the adapter needs to catch them
+            glue_client.exceptions.EntityNotFoundException = ClientError
+            yield glue_client
 
-    @mock_glue
-    @mock_s3
-    @mock_athena
     def test_get_table_location(self, dbt_debug_caplog):
         table_name = "test_table"
-        self.adapter.acquire_connection("dummy")
-        self.mock_aws_service.create_data_catalog()
-        self.mock_aws_service.create_database()
         self.mock_aws_service.create_table(table_name)
         assert self.adapter.get_table_location(DATABASE_NAME, table_name) == "s3://test-dbt-athena/tables/test_table"
 
-    @mock_glue
-    @mock_s3
-    @mock_athena
-    def test_get_table_location_with_failure(self, dbt_debug_caplog):
+    def test_get_table_location_with_failure(self, mock_glue_client, dbt_debug_caplog):
         table_name = "test_table"
-        self.adapter.acquire_connection("dummy")
-        self.mock_aws_service.create_data_catalog()
-        self.mock_aws_service.create_database()
+        mock_glue_client.get_table.side_effect = ClientError({"Error": {"Code": "EntityNotFoundException"}}, "GetTable")
         assert self.adapter.get_table_location(DATABASE_NAME, table_name) is None
         assert f"Table '{table_name}' does not exists - Ignoring" in dbt_debug_caplog.getvalue()
 
-    @pytest.fixture(scope="function")
-    def aws_credentials(self):
-        """Mocked AWS Credentials for moto."""
-        os.environ["AWS_ACCESS_KEY_ID"] = "testing"
-        os.environ["AWS_SECRET_ACCESS_KEY"] = "testing"
-        os.environ["AWS_SECURITY_TOKEN"] = "testing"
-        os.environ["AWS_SESSION_TOKEN"] = "testing"
-        os.environ["AWS_DEFAULT_REGION"] = AWS_REGION
-
-    @mock_glue
-    @mock_s3
-    @mock_athena
-    def test_clean_up_partitions_will_work(self, dbt_debug_caplog, aws_credentials):
+    def test_clean_up_partitions_will_work(self, dbt_debug_caplog, s3_client):
         table_name = "table"
-        self.mock_aws_service.create_data_catalog()
-        self.mock_aws_service.create_database()
         self.mock_aws_service.create_table(table_name)
         self.mock_aws_service.add_data_in_table(table_name)
-        self.adapter.acquire_connection("dummy")
         self.adapter.clean_up_partitions(DATABASE_NAME, table_name, "dt < '2022-01-03'")
         log_records = dbt_debug_caplog.getvalue()
-        assert (
-            "Deleting table data: path="
-            "'s3://test-dbt-athena/tables/table/dt=2022-01-01', "
-            "bucket='test-dbt-athena', "
-            "prefix='tables/table/dt=2022-01-01/'" in log_records
-        )
-        assert (
-            "Deleting table data: path="
-            "'s3://test-dbt-athena/tables/table/dt=2022-01-02', "
-            "bucket='test-dbt-athena', "
-            "prefix='tables/table/dt=2022-01-02/'" in log_records
-        )
-        s3 = boto3.client("s3", region_name=AWS_REGION)
-        keys = [obj["Key"] for obj in s3.list_objects_v2(Bucket=BUCKET)["Contents"]]
-        assert set(keys) == {"tables/table/dt=2022-01-03/data1.parquet", "tables/table/dt=2022-01-03/data2.parquet"}
-
-    @mock_glue
-    @mock_athena
-    def test_clean_up_table_table_does_not_exist(self, dbt_debug_caplog, aws_credentials):
-        self.mock_aws_service.create_data_catalog()
-        self.mock_aws_service.create_database()
-        self.adapter.acquire_connection("dummy")
+        assert set(_CLEAN_UP_PARTITIONS_LOGS_RE.findall(log_records)) == set(_CLEAN_UP_PARTITIONS_LOGS)
+        keys = [obj["Key"] for obj in s3_client.list_objects_v2(Bucket=BUCKET)["Contents"]]
+        assert sorted(keys) == ["tables/table/dt=2022-01-03/data1.parquet", "tables/table/dt=2022-01-03/data2.parquet"]
+
+    def test_clean_up_table_table_does_not_exist(self, dbt_debug_caplog):
         result = self.adapter.clean_up_table(DATABASE_NAME, "table")
         assert result is None
         assert "Table 'table' does not exists - Ignoring" in dbt_debug_caplog.getvalue()
 
-    @mock_glue
-    @mock_athena
-    def test_clean_up_table_view(self, dbt_debug_caplog, aws_credentials):
-        self.mock_aws_service.create_data_catalog()
-        self.mock_aws_service.create_database()
-        self.adapter.acquire_connection("dummy")
+    def test_clean_up_table_view(self, dbt_debug_caplog):
         self.mock_aws_service.create_view("test_view")
         result = self.adapter.clean_up_table(DATABASE_NAME, "test_view")
         assert result is None
 
-    @mock_glue
-    @mock_s3
-    @mock_athena
-    def test_clean_up_table_delete_table(self, dbt_debug_caplog, aws_credentials):
-        self.mock_aws_service.create_data_catalog()
-        self.mock_aws_service.create_database()
+    def test_clean_up_table_delete_table(self, dbt_debug_caplog, s3_client):
         self.mock_aws_service.create_table("table")
         self.mock_aws_service.add_data_in_table("table")
-        self.adapter.acquire_connection("dummy")
         self.adapter.clean_up_table(DATABASE_NAME, "table")
         assert (
             "Deleting table data: path='s3://test-dbt-athena/tables/table', "
             "bucket='test-dbt-athena', "
             "prefix='tables/table/'" in dbt_debug_caplog.getvalue()
         )
-        s3 = boto3.client("s3", region_name=AWS_REGION)
-        objs = s3.list_objects_v2(Bucket=BUCKET)
+        objs = s3_client.list_objects_v2(Bucket=BUCKET)
         assert objs["KeyCount"] == 0
 
-    @patch("dbt.adapters.athena.impl.SQLAdapter.quote_seed_column")
-    def test_quote_seed_column(self, parent_quote_seed_column):
-        self.adapter.quote_seed_column("col", None)
-        parent_quote_seed_column.assert_called_once_with("col", False)
-
-    @mock_glue
-    @mock_athena
-    @mock_sts
-    def test__get_one_catalog(self):
-        self.mock_aws_service.create_data_catalog()
+    def test__get_one_catalog(self, mock_manifest):
         self.mock_aws_service.create_database("foo")
         self.mock_aws_service.create_database("quux")
         self.mock_aws_service.create_database("baz")
@@ -479,7 +303,6 @@ class TestAthenaAdapter:
         mock_information_schema = mock.MagicMock()
         mock_information_schema.path.database = "awsdatacatalog"
 
-        self.adapter.acquire_connection("dummy")
         actual = self.adapter._get_one_catalog(
             mock_information_schema,
             {
@@ -487,40 +310,14 @@ class TestAthenaAdapter:
                 "quux": {"bar"},
                 "baz": {"qux"},
             },
-            self.mock_manifest,
-        )
-
-        expected_column_names = (
-            "table_database",
-            "table_schema",
-            "table_name",
-            "table_type",
-            "table_comment",
-            "column_name",
-            "column_index",
-            "column_type",
-            "column_comment",
-            "table_owner",
+            mock_manifest,
         )
-        expected_rows = [
-            ("awsdatacatalog", "foo", "bar", "table", None, "id", 0, "string", None, "data-engineers"),
-            ("awsdatacatalog", "foo", "bar", "table", None, "country", 1, "string", None, "data-engineers"),
-            ("awsdatacatalog", "foo", "bar", "table", None, "dt", 2, "date", None, "data-engineers"),
-            ("awsdatacatalog", "quux", "bar", "table", None, "id", 0, "string", None, "data-analysts"),
-            ("awsdatacatalog", "quux", "bar", "table", None, "country", 1, "string", None, "data-analysts"),
-            ("awsdatacatalog", "quux", "bar", "table", None, "dt", 2, "date", None, "data-analysts"),
-            ("awsdatacatalog", "baz", "qux", "table", None, "id", 0, "string", None, "data-engineers"),
-            ("awsdatacatalog", "baz", "qux", "table", None, "country", 1, "string", None, "data-engineers"),
-        ]
-
-        assert actual.column_names == expected_column_names
-        assert len(actual.rows) == len(expected_rows)
+        assert actual.column_names == _CATALOG_COLUMN_NAMES
+        assert len(actual.rows) == len(_ONE_CATALOG_ROWS)
         for row in actual.rows.values():
-            assert row.values() in expected_rows
+            assert tuple(row.values()) in _ONE_CATALOG_ROWS
 
-    @mock_glue
-    @mock_athena
-    def test__get_one_catalog_shared_catalog(self):
+    def test__get_one_catalog_shared_catalog(self, mock_manifest):
         self.mock_aws_service.create_data_catalog(
             catalog_name=SHARED_DATA_CATALOG_NAME, catalog_id=SHARED_DATA_CATALOG_NAME
         )
@@ -529,113 +326,59 @@ class TestAthenaAdapter:
         mock_information_schema = mock.MagicMock()
         mock_information_schema.path.database = SHARED_DATA_CATALOG_NAME
 
-        self.adapter.acquire_connection("dummy")
         actual = self.adapter._get_one_catalog(
             mock_information_schema,
             {
                 "foo": {"bar"},
             },
-            self.mock_manifest,
-        )
-
-        expected_column_names = (
-            "table_database",
-            "table_schema",
-            "table_name",
-            "table_type",
-            "table_comment",
-            "column_name",
-            "column_index",
-            "column_type",
-            "column_comment",
-            "table_owner",
+            mock_manifest,
         )
-        expected_rows = [
-            ("9876543210", "foo", "bar", "table", None, "id", 0, "string", None, "data-engineers"),
-            ("9876543210", "foo", "bar", "table", None, "country", 1, "string", None, "data-engineers"),
-            ("9876543210", "foo", "bar", "table", None, "dt", 2, "date", None, "data-engineers"),
-        ]
-
-        assert actual.column_names == expected_column_names
-        assert len(actual.rows) == len(expected_rows)
+        assert actual.column_names == _CATALOG_COLUMN_NAMES
+        assert len(actual.rows) == len(_SHARED_CATALOG_ROWS)
         for row in actual.rows.values():
-            assert row.values() in expected_rows
-
-    def test__get_catalog_schemas(self):
-        res = self.adapter._get_catalog_schemas(self.mock_manifest)
-        assert len(res.keys()) == 2
+            assert tuple(row.values()) in _SHARED_CATALOG_ROWS
 
-        information_schema_0 = list(res.keys())[0]
-        assert information_schema_0.name == "INFORMATION_SCHEMA"
-        assert information_schema_0.schema is None
-        assert information_schema_0.database == "awsdatacatalog"
-        relations = list(res.values())[0]
-        assert set(relations.keys()) == {"foo", "quux", "baz"}
-        assert list(relations.values()) == [{"bar"}, {"bar"}, {"qux"}]
-
-        information_schema_1 = list(res.keys())[1]
-        assert information_schema_1.name == "INFORMATION_SCHEMA"
-        assert information_schema_1.schema is None
-        assert information_schema_1.database == SHARED_DATA_CATALOG_NAME
-        relations = list(res.values())[1]
-        assert set(relations.keys()) == {"foo"}
-        assert list(relations.values()) == [{"bar"}]
-
-    @mock_athena
-    @mock_sts
-    def test__get_data_catalog(self, aws_credentials):
-        self.mock_aws_service.create_data_catalog()
-        self.adapter.acquire_connection("dummy")
+    def test__get_data_catalog(self):
         res = self.adapter._get_data_catalog(DATA_CATALOG_NAME)
         assert {"Name": "awsdatacatalog", "Type": "GLUE", "Parameters": {"catalog-id": DEFAULT_ACCOUNT_ID}} == res
 
-    @mock_glue
-    @mock_s3
-    @mock_athena
-    def test__get_relation_type_table(self, aws_credentials):
-        self.mock_aws_service.create_data_catalog()
-        self.mock_aws_service.create_database()
-        self.mock_aws_service.create_table("test_table")
-        self.adapter.acquire_connection("dummy")
-        table_type = self.adapter.get_table_type(DATABASE_NAME, "test_table")
-        assert table_type == TableType.TABLE
-
-    @mock_glue
-    @mock_s3
-    @mock_athena
-    def test__get_relation_type_with_no_type(self, aws_credentials):
-        self.mock_aws_service.create_data_catalog()
-        self.mock_aws_service.create_database()
-        self.mock_aws_service.create_table_without_table_type("test_table")
-        self.adapter.acquire_connection("dummy")
-
-        with pytest.raises(ValueError):
-            self.adapter.get_table_type(DATABASE_NAME, "test_table")
-
-    @mock_glue
-    @mock_s3
-    @mock_athena
-    def test__get_relation_type_view(self, aws_credentials):
-        self.mock_aws_service.create_data_catalog()
-        self.mock_aws_service.create_database()
-        self.mock_aws_service.create_view("test_view")
-        self.adapter.acquire_connection("dummy")
-        table_type = self.adapter.get_table_type(DATABASE_NAME, "test_view")
-        assert table_type == TableType.VIEW
-
-    @mock_glue
-    @mock_s3
-    @mock_athena
-    def test__get_relation_type_iceberg(self, aws_credentials):
-        self.mock_aws_service.create_data_catalog()
-        self.mock_aws_service.create_database()
-        self.mock_aws_service.create_iceberg_table("test_iceberg")
-        self.adapter.acquire_connection("dummy")
-        table_type = self.adapter.get_table_type(DATABASE_NAME, "test_iceberg")
-        assert table_type == TableType.ICEBERG
-
-    def _test_list_relations_without_caching(self, schema_relation):
-        self.adapter.acquire_connection("dummy")
+    @pytest.mark.parametrize(
+        "table,expected",
+        [
+            pytest.param({"TableType": "table"}, TableType.TABLE, id="table"),
+            pytest.param({"TableType": "VIRTUAL_VIEW"}, TableType.VIEW, id="view"),
+            pytest.param(
+                {"TableType": "EXTERNAL_TABLE", "Parameters": {"table_type": "iceberg"}},
+                TableType.ICEBERG,
+                id="iceberg",
+            ),
+            pytest.param({}, None, id="no table type", marks=pytest.mark.xfail(raises=ValueError, strict=True)),
+        ],
+    )
+    def test__get_relation_type(self, mock_glue_client, table, expected):
+        mock_glue_client.get_table.return_value = {"Table": {"Name": "test_relation", **table}}
+        table_type = self.adapter.get_table_type(DATABASE_NAME, "test_relation")
+        assert table_type == expected
+        mock_glue_client.get_table.assert_called_once_with(DatabaseName=DATABASE_NAME, Name="test_relation")
+
+    @pytest.fixture
+    def data_catalog_name(self, request):
+        # athena_env already registers the default catalog
+        if request.param != DATA_CATALOG_NAME:
+            self.mock_aws_service.create_data_catalog(request.param)
+        return request.param
+
+    @pytest.mark.parametrize("data_catalog_name", [DATA_CATALOG_NAME, "other_data_catalog"], indirect=True)
+    def test_list_relations_without_caching(self, data_catalog_name):
+        self.mock_aws_service.create_table("table")
+        self.mock_aws_service.create_table("other")
+        self.mock_aws_service.create_view("view")
+        self.mock_aws_service.create_table_without_table_type("without_table_type")
+        schema_relation = self.adapter.Relation.create(
+            database=data_catalog_name,
+            schema=DATABASE_NAME,
+            quote_policy=self.adapter.config.quoting,
+        )
         relations = self.adapter.list_relations_without_caching(schema_relation)
         assert len(relations) == 3
         assert all(isinstance(rel, AthenaRelation) for rel in relations)
@@ -650,41 +393,6 @@ class TestAthenaAdapter:
         assert view.name == "view"
         assert view.type == "view"
 
-    @mock_athena
-    @mock_glue
-    @mock_sts
-    def test_list_relations_without_caching_with_awsdatacatalog(self, aws_credentials):
-        self.mock_aws_service.create_data_catalog()
-        self.mock_aws_service.create_database()
-        self.mock_aws_service.create_table("table")
-        self.mock_aws_service.create_table("other")
-        self.mock_aws_service.create_view("view")
-        self.mock_aws_service.create_table_without_table_type("without_table_type")
-        schema_relation = self.adapter.Relation.create(
-            database=DATA_CATALOG_NAME,
-            schema=DATABASE_NAME,
-            quote_policy=self.adapter.config.quoting,
-        )
-        self._test_list_relations_without_caching(schema_relation)
-
-    @mock_athena
-    @mock_glue
-    def test_list_relations_without_caching_with_other_glue_data_catalog(self, aws_credentials):
-        data_catalog_name = "other_data_catalog"
-        self.mock_aws_service.create_data_catalog(data_catalog_name)
-        self.mock_aws_service.create_database()
-        self.mock_aws_service.create_table("table")
-        self.mock_aws_service.create_table("other")
-        self.mock_aws_service.create_view("view")
-        self.mock_aws_service.create_table_without_table_type("without_table_type")
-        schema_relation = self.adapter.Relation.create(
-            database=data_catalog_name,
-            schema=DATABASE_NAME,
-            quote_policy=self.adapter.config.quoting,
-        )
-        self._test_list_relations_without_caching(schema_relation)
-
-    @mock_athena
     @patch("dbt.adapters.athena.impl.SQLAdapter.list_relations_without_caching", return_value=[])
     def test_list_relations_without_caching_with_non_glue_data_catalog(self, parent_list_relations_without_caching):
         data_catalog_name = "other_data_catalog"
@@ -694,134 +402,61 @@ class TestAthenaAdapter:
             schema=DATABASE_NAME,
             quote_policy=self.adapter.config.quoting,
         )
-        self.adapter.acquire_connection("dummy")
         self.adapter.list_relations_without_caching(schema_relation)
         parent_list_relations_without_caching.assert_called_once_with(schema_relation)
 
+    def _create_table_for_swap(self, table_name, with_partitions):
+        if with_partitions:
+            self.mock_aws_service.create_table(table_name)
+            self.mock_aws_service.add_partitions_to_table(DATABASE_NAME, table_name)
+        else:
+            self.mock_aws_service.create_table_without_partitions(table_name)
+
     @pytest.mark.parametrize(
-        "s3_path,expected",
+        "source_has_partitions,target_has_partitions,expected_target_partitions",
         [
-            ("s3://my-bucket/test-dbt/tables/schema/table", ("my-bucket", "test-dbt/tables/schema/table/")),
-            ("s3://my-bucket/test-dbt/tables/schema/table/", ("my-bucket", "test-dbt/tables/schema/table/")),
+            pytest.param(True, True, 3, id="with partitions"),
+            pytest.param(False, False, 0, id="without partitions"),
+            pytest.param(False, True, 0, id="with partitions to one without"),
+            pytest.param(True, False, 3, id="with no partitions to one with"),
         ],
     )
-    def test_parse_s3_path(self, s3_path, expected):
-        assert self.adapter._parse_s3_path(s3_path) == expected
-
-    @mock_athena
-    @mock_glue
-    @mock_s3
-    def test_swap_table_with_partitions(self, aws_credentials):
-        self.mock_aws_service.create_data_catalog()
-        self.mock_aws_service.create_database()
-        self.adapter.acquire_connection("dummy")
+    def test_swap_table(self, glue_client, source_has_partitions, target_has_partitions, expected_target_partitions):
         target_table = "target_table"
         source_table = "source_table"
-        self.mock_aws_service.create_table(source_table)
-        self.mock_aws_service.add_partitions_to_table(DATABASE_NAME, source_table)
-        self.mock_aws_service.create_table(target_table)
-        self.mock_aws_service.add_partitions_to_table(DATABASE_NAME, source_table)
-        self.adapter.swap_table(DATABASE_NAME, source_table, DATABASE_NAME, target_table)
-        assert self.adapter.get_table_location(DATABASE_NAME, target_table) == f"s3://{BUCKET}/tables/{source_table}"
-
-    @mock_athena
-    @mock_glue
-    @mock_s3
-    def test_swap_table_without_partitions(self, aws_credentials):
-        self.mock_aws_service.create_data_catalog()
-        self.mock_aws_service.create_database()
-        self.adapter.acquire_connection("dummy")
-        target_table = "target_table"
-        source_table = "source_table"
-        self.mock_aws_service.create_table_without_partitions(source_table)
-        self.mock_aws_service.create_table_without_partitions(target_table)
-        self.adapter.swap_table(DATABASE_NAME, source_table, DATABASE_NAME, target_table)
-        assert self.adapter.get_table_location(DATABASE_NAME, target_table) == f"s3://{BUCKET}/tables/{source_table}"
-
-    @mock_athena
-    @mock_glue
-    @mock_s3
-    def test_swap_table_with_partitions_to_one_without(self, aws_credentials):
-        self.mock_aws_service.create_data_catalog()
-        self.mock_aws_service.create_database()
-        self.adapter.acquire_connection("dummy")
-        target_table = "target_table"
-        source_table = "source_table"
-        # source table does not have partitions
-        self.mock_aws_service.create_table_without_partitions(source_table)
-
-        # the target table has partitions
-        self.mock_aws_service.create_table(target_table)
-        self.mock_aws_service.add_partitions_to_table(DATABASE_NAME, target_table)
-
-        self.adapter.swap_table(DATABASE_NAME, source_table, DATABASE_NAME, target_table)
-        glue_client = boto3.client("glue", region_name=AWS_REGION)
-
-        target_table_partitions = glue_client.get_partitions(DatabaseName=DATABASE_NAME, TableName=target_table).get(
-            "Partitions"
-        )
+        self._create_table_for_swap(source_table, source_has_partitions)
+        self._create_table_for_swap(target_table, target_has_partitions)
+        # only check whether the target has partitions at all, counting them is left to the post-swap assertion
+        target_partitions = glue_client.get_partitions(
+            DatabaseName=DATABASE_NAME, TableName=target_table, MaxResults=1
+        ).get("Partitions")
+        assert bool(target_partitions) is target_has_partitions
 
-        assert self.adapter.get_table_location(DATABASE_NAME, target_table) == f"s3://{BUCKET}/tables/{source_table}"
-        assert len(target_table_partitions) == 0
-
-    @mock_athena
-    @mock_glue
-    @mock_s3
-    def test_swap_table_with_no_partitions_to_one_with(self, aws_credentials):
-        self.mock_aws_service.create_data_catalog()
-        self.mock_aws_service.create_database()
-        self.adapter.acquire_connection("dummy")
-        target_table = "target_table"
-        source_table = "source_table"
-        self.mock_aws_service.create_table(source_table)
-        self.mock_aws_service.add_partitions_to_table(DATABASE_NAME, source_table)
-        self.mock_aws_service.create_table_without_partitions(target_table)
-        glue_client = boto3.client("glue", region_name=AWS_REGION)
-        target_table_partitions = glue_client.get_partitions(DatabaseName=DATABASE_NAME, TableName=target_table).get(
-            "Partitions"
-        )
-        assert len(target_table_partitions) == 0
         self.adapter.swap_table(DATABASE_NAME, source_table, DATABASE_NAME, target_table)
-        target_table_partitions_after = glue_client.get_partitions(
-            DatabaseName=DATABASE_NAME, TableName=target_table
-        ).get("Partitions")
 
         assert self.adapter.get_table_location(DATABASE_NAME, target_table) == f"s3://{BUCKET}/tables/{source_table}"
-        assert len(target_table_partitions_after) == 3
+        assert _count_partitions(glue_client, target_table) == expected_target_partitions
 
-    @mock_athena
-    @mock_glue
-    def test__get_glue_table_versions_to_expire(self, aws_credentials, dbt_debug_caplog):
-        self.mock_aws_service.create_data_catalog()
-        self.mock_aws_service.create_database()
-        self.adapter.acquire_connection("dummy")
+    def test__get_glue_table_versions_to_expire(self, dbt_debug_caplog, glue_client):
         table_name = "my_table"
         self.mock_aws_service.create_table(table_name)
-        self.mock_aws_service.add_table_version(DATABASE_NAME, table_name)
-        self.mock_aws_service.add_table_version(DATABASE_NAME, table_name)
-        self.mock_aws_service.add_table_version(DATABASE_NAME, table_name)
-        glue = boto3.client("glue", region_name=AWS_REGION)
-        table_versions = glue.get_table_versions(DatabaseName=DATABASE_NAME, TableName=table_name).get("TableVersions")
+        self.mock_aws_service.add_table_versions(DATABASE_NAME, table_name, 3)
+        table_versions = glue_client.get_table_versions(DatabaseName=DATABASE_NAME, TableName=table_name).get(
+            "TableVersions"
+        )
         assert len(table_versions) == 4
         version_to_keep = 1
         versions_to_expire = self.adapter._get_glue_table_versions_to_expire(DATABASE_NAME, table_name, version_to_keep)
         assert len(versions_to_expire) == 3
         assert [v["VersionId"] for v in versions_to_expire] == ["3", "2", "1"]
 
-    @mock_athena
-    @mock_glue
-    @mock_s3
-    def test_expire_glue_table_versions(self, aws_credentials):
-        self.mock_aws_service.create_data_catalog()
-        self.mock_aws_service.create_database()
-        self.adapter.acquire_connection("dummy")
+    def test_expire_glue_table_versions(self, glue_client):
         table_name = "my_table"
         self.mock_aws_service.create_table(table_name)
-        self.mock_aws_service.add_table_version(DATABASE_NAME, table_name)
-        self.mock_aws_service.add_table_version(DATABASE_NAME, table_name)
-        self.mock_aws_service.add_table_version(DATABASE_NAME, table_name)
-        glue = boto3.client("glue", region_name=AWS_REGION)
-        table_versions = glue.get_table_versions(DatabaseName=DATABASE_NAME, TableName=table_name).get("TableVersions")
+        self.mock_aws_service.add_table_versions(DATABASE_NAME, table_name, 3)
+        table_versions = glue_client.get_table_versions(DatabaseName=DATABASE_NAME, TableName=table_name).get(
+            "TableVersions"
+        )
         assert len(table_versions) == 4
         version_to_keep = 1
         self.adapter.expire_glue_table_versions(DATABASE_NAME, table_name, version_to_keep, False)
@@ -829,15 +464,10 @@ class TestAthenaAdapter:
         # TODO moto issue https://github.com/getmoto/moto/issues/5952
         # assert len(result) == 3
 
-    @mock_s3
-    def test_upload_seed_to_s3(self, aws_credentials):
-        seed_table = agate.Table.from_object(seed_data)
-        self.adapter.acquire_connection("dummy")
-
+    def test_upload_seed_to_s3(self, s3_client, seed_agate_table):
         database = "db_seeds"
         table = "data"
 
-        s3_client = boto3.client("s3", region_name=AWS_REGION)
         s3_client.create_bucket(Bucket=BUCKET, CreateBucketConfiguration={"LocationConstraint": AWS_REGION})
 
         location = self.adapter.upload_seed_to_s3(
@@ -846,220 +476,310 @@ class TestAthenaAdapter:
             external_location=None,
             database_name=database,
             table_name=table,
-            table=seed_table,
+            table=seed_agate_table,
         )
 
         prefix = "db_seeds/data"
-        objects = s3_client.list_objects(Bucket=BUCKET, Prefix=prefix).get("Contents")
+        objects = s3_client.list_objects_v2(Bucket=BUCKET, Prefix=prefix).get("Contents")
+
+        assert location == f"s3://{BUCKET}/{prefix}"
+        assert len(objects) == 1
+        assert objects[0].get("Key").endswith(".csv")
+
+    def test_upload_seed_to_s3_external_location(self, s3_client, seed_agate_table):
+        bucket = "my-external-location"
+        prefix = "seeds/one"
+        external_location = f"s3://{bucket}/{prefix}"
+
+        s3_client.create_bucket(Bucket=bucket, CreateBucketConfiguration={"LocationConstraint": AWS_REGION})
+
+        location = self.adapter.upload_seed_to_s3(
+            s3_data_dir=None,
+            s3_data_naming="schema_table",
+            external_location=external_location,
+            database_name="db_seeds",
+            table_name="data",
+            table=seed_agate_table,
+        )
+
+        objects = s3_client.list_objects_v2(Bucket=bucket, Prefix=prefix).get("Contents")
+
+        assert location == f"s3://{bucket}/{prefix}"
+        assert len(objects) == 1
+        assert objects[0].get("Key").endswith(".csv")
+
+    @pytest.mark.parametrize(
+        "persist_relation,persist_columns,expected_desc",
+        [
+            pytest.param(False, False, "", id="no comment"),
+            pytest.param(True, True, "A table with str, 123, &^% \" and ' and an other paragraph.", id="comment"),
+        ],
+    )
+    def test_persist_docs_to_glue(self, glue_client, make_relation, persist_relation, persist_columns, expected_desc):
+        table_name = "my_table"
+        self.mock_aws_service.create_table(table_name)
+        schema_relation = make_relation(table_name)
+        self.adapter.persist_docs_to_glue(schema_relation, PERSIST_DOCS_PAYLOAD, persist_relation, persist_columns)
+        table = glue_client.get_table(DatabaseName=DATABASE_NAME, Name=table_name).get("Table")
+        if expected_desc:
+            assert table["Description"] == expected_desc
+            assert table["Parameters"]["comment"] == expected_desc
+            col_id = [col for col in table["StorageDescriptor"]["Columns"] if col["Name"] == "id"][0]
+            assert col_id["Comment"] == "A column with str, 123, &^% \" and ' and an other paragraph."
+        else:
+            assert not table.get("Description", "")
+            assert not table["Parameters"].get("comment")
+            assert all(not col.get("Comment") for col in table["StorageDescriptor"]["Columns"])
+
+    def test_list_schemas(self):
+        self.mock_aws_service.create_databases(["foo", "bar", "quux"])
+        res = self.adapter.list_schemas("")
+        assert sorted(res) == ["bar", "foo", "quux", DATABASE_NAME]
+
+    def test_get_columns_in_relation(self, make_relation):
+        self.mock_aws_service.create_table("tbl_name")
+        assert tuple(self.adapter.get_columns_in_relation(make_relation())) == EXPECTED_TBL_NAME_COLUMNS
+
+    def test_get_columns_in_relation_not_found_table(self, mock_glue_client, make_relation):
+        mock_glue_client.get_table.side_effect = ClientError({"Error": {"Code": "EntityNotFoundException"}}, "GetTable")
+        columns = self.adapter.get_columns_in_relation(make_relation())
+        assert columns == []
+
+    def test_delete_from_glue_catalog(self, glue_client, make_relation):
+        self.mock_aws_service.create_table("tbl_name")
+        relation = make_relation()
+        self.adapter.delete_from_glue_catalog(relation)
+        with pytest.raises(glue_client.exceptions.EntityNotFoundException):
+            glue_client.get_table(DatabaseName=DATABASE_NAME, Name="tbl_name")
+
+    def test_delete_from_glue_catalog_not_found_table(self, dbt_debug_caplog, make_relation):
+        self.mock_aws_service.create_table("tbl_name")
+        relation = make_relation("tbl_does_not_exist")
+        delete_table = self.adapter.delete_from_glue_catalog(relation)
+        assert delete_table is None
+        error_msg = f"Table {relation.render()} does not exist and will not be deleted, ignoring"
+        assert error_msg in dbt_debug_caplog.getvalue()
+
 
-        assert location == f"s3://{BUCKET}/{prefix}"
-        assert len(objects) == 1
-        assert objects[0].get("Key").endswith(".csv")
+class TestAthenaAdapterPure:
+    @pytest.fixture(scope="class", autouse=True)
+    def _adapter(self, request):
+        request.cls.adapter = AthenaAdapter(config_from_parts_or_dicts(_PROJECT_CFG, _PROFILE_CFG))
 
-    @mock_s3
-    def test_upload_seed_to_s3_external_location(self, aws_credentials):
-        seed_table = agate.Table.from_object(seed_data)
-        self.adapter.acquire_connection("dummy")
+    @pytest.fixture(autouse=True)
+    def _reset_connections(self):
+        yield
+        # every test starts from a thread without a connection
+        self.adapter.connections.cleanup_all()
 
-        bucket = "my-external-location"
-        prefix = "seeds/one"
-        external_location = f"s3://{bucket}/{prefix}"
+    @pytest.fixture(scope="class")
+    def athena_client(self):
+        return boto3.client("athena", region_name=AWS_REGION)
 
-        s3_client = boto3.client("s3", region_name=AWS_REGION)
-        s3_client.create_bucket(Bucket=bucket, CreateBucketConfiguration={"LocationConstraint": AWS_REGION})
+    @mock.patch("dbt.adapters.athena.connections.AthenaConnection")
+    def test_acquire_connection_validations(self, connection_cls):
+        try:
+            connection = self.adapter.acquire_connection("dummy")
+        except DbtRuntimeError as e:
+            pytest.fail(f"got ValidationException: {e}")
+        except BaseException as e:
+            pytest.fail(f"acquiring connection failed with unknown exception: {e}")
 
-        location = self.adapter.upload_seed_to_s3(
-            s3_data_dir=None,
-            s3_data_naming="schema_table",
-            external_location=external_location,
-            database_name="db_seeds",
-            table_name="data",
-            table=seed_table,
+        connection_cls.assert_not_called()
+        connection.handle
+        connection_cls.assert_called_once()
+        _, arguments = connection_cls.call_args_list[0]
+        assert arguments["s3_staging_dir"] == "s3://my-bucket/test-dbt/"
+        assert arguments["endpoint_url"] is None
+        assert arguments["schema_name"] == "test_dbt_athena"
+        assert arguments["work_group"] == "dbt-athena-adapter"
+        assert arguments["cursor_class"] == AthenaCursor
+        assert isinstance(arguments["formatter"], AthenaParameterFormatter)
+        assert arguments["poll_interval"] == 1.0
+        assert arguments["retry_config"].attempt == 5
+        assert arguments["retry_config"].exceptions == (
+            "ThrottlingException",
+            "TooManyRequestsException",
+            "InternalServerException",
         )
 
-        objects = s3_client.list_objects(Bucket=bucket, Prefix=prefix).get("Contents")
+    @mock.patch("dbt.adapters.athena.connections.AthenaConnection")
+    def test_acquire_connection(self, connection_cls):
+        connection = self.adapter.acquire_connection("dummy")
 
-        assert location == f"s3://{bucket}/{prefix}"
-        assert len(objects) == 1
-        assert objects[0].get("Key").endswith(".csv")
+        connection_cls.assert_not_called()
+        connection.handle
+        assert connection.state == ConnectionState.OPEN
+        assert connection.handle is not None
+        connection_cls.assert_called_once()
 
-    @mock_athena
-    def test_get_work_group_output_location(self, aws_credentials):
-        self.adapter.acquire_connection("dummy")
-        self.mock_aws_service.create_work_group_with_output_location_enforced(ATHENA_WORKGROUP)
-        work_group_location_enforced = self.adapter.is_work_group_output_location_enforced()
-        assert work_group_location_enforced
+    @mock.patch("dbt.adapters.athena.connections.AthenaConnection")
+    def test_acquire_connection_exc(self, connection_cls, dbt_error_caplog):
+        connection_cls.side_effect = lambda **_: (_ for _ in ()).throw(Exception("foobar"))
+        connection = self.adapter.acquire_connection("dummy")
+        conn_res = None
+        with pytest.raises(ConnectionError) as exc:
+            conn_res = connection.handle
 
-    @mock_athena
-    def test_get_work_group_output_location_no_location(self, aws_credentials):
-        self.adapter.acquire_connection("dummy")
-        self.mock_aws_service.create_work_group_no_output_location(ATHENA_WORKGROUP)
-        work_group_location_enforced = self.adapter.is_work_group_output_location_enforced()
-        assert not work_group_location_enforced
+        assert conn_res is None
+        assert connection.state == ConnectionState.FAIL
+        assert exc.value.__str__() == "foobar"
+        assert "Got an error when attempting to open a Athena connection due to foobar" in dbt_error_caplog.getvalue()
 
-    @mock_athena
-    def test_get_work_group_output_location_not_enforced(self, aws_credentials):
-        self.adapter.acquire_connection("dummy")
-        self.mock_aws_service.create_work_group_with_output_location_not_enforced(ATHENA_WORKGROUP)
-        work_group_location_enforced = self.adapter.is_work_group_output_location_enforced()
-        assert not work_group_location_enforced
-
-    @mock_athena
-    @mock_glue
-    @mock_s3
-    def test_persist_docs_to_glue_no_comment(self):
-        self.mock_aws_service.create_data_catalog()
-        self.mock_aws_service.create_database()
-        self.adapter.acquire_connection("dummy")
-        table_name = "my_table"
-        self.mock_aws_service.create_table(table_name)
-        schema_relation = self.adapter.Relation.create(
-            database=DATA_CATALOG_NAME,
-            schema=DATABASE_NAME,
-            identifier=table_name,
-        )
-        self.adapter.persist_docs_to_glue(
-            schema_relation,
-            {
-                "description": """
-                        A table with str, 123, &^% \" and '
+    def test__get_catalog_schemas(self, mock_manifest):
+        res = self.adapter._get_catalog_schemas(mock_manifest)
+        assert len(res.keys()) == 2
 
-                          and an other paragraph.
-                    """,
-                "columns": {
-                    "id": {
-                        "description": """
-                        A column with str, 123, &^% \" and '
+        information_schema_0 = list(res.keys())[0]
+        assert information_schema_0.name == "INFORMATION_SCHEMA"
+        assert information_schema_0.schema is None
+        assert information_schema_0.database == "awsdatacatalog"
+        relations = list(res.values())[0]
+        assert set(relations.keys()) == {"foo", "quux", "baz"}
+        assert list(relations.values()) == [{"bar"}, {"bar"}, {"qux"}]
 
-                          and an other paragraph.
-                    """,
-                    }
-                },
-            },
-            False,
-            False,
-        )
-        glue = boto3.client("glue", region_name=AWS_REGION)
-        table = glue.get_table(DatabaseName=DATABASE_NAME, Name=table_name).get("Table")
-        assert not table.get("Description", "")
-        assert not table["Parameters"].get("comment")
-        assert all(not col.get("Comment") for col in table["StorageDescriptor"]["Columns"])
-
-    @mock_athena
-    @mock_glue
-    @mock_s3
-    def test_persist_docs_to_glue_comment(self):
-        self.mock_aws_service.create_data_catalog()
-        self.mock_aws_service.create_database()
+        information_schema_1 = list(res.keys())[1]
+        assert information_schema_1.name == "INFORMATION_SCHEMA"
+        assert information_schema_1.schema is None
+        assert information_schema_1.database == SHARED_DATA_CATALOG_NAME
+        relations = list(res.values())[1]
+        assert set(relations.keys()) == {"foo"}
+        assert list(relations.values()) == [{"bar"}]
+
+    @pytest.mark.parametrize(
+        ("s3_data_dir", "s3_data_naming", "s3_path_table_part", "external_location", "is_temporary_table", "expected"),
+        (
+            pytest.param(None, "table", None, None, False, "s3://my-bucket/test-dbt/tables/table", id="table naming"),
+            pytest.param(None, "uuid", None, None, False, "s3://my-bucket/test-dbt/tables/uuid", id="uuid naming"),
+            pytest.param(
+                None,
+                "table_unique",
+                None,
+                None,
+                False,
+                "s3://my-bucket/test-dbt/tables/table/uuid",
+                id="table_unique naming",
+            ),
+            pytest.param(
+                None,
+                "schema_table",
+                None,
+                None,
+                False,
+                "s3://my-bucket/test-dbt/tables/schema/table",
+                id="schema_table naming",
+            ),
+            pytest.param(
+                None,
+                "schema_table_unique",
+                None,
+                None,
+                False,
+                "s3://my-bucket/test-dbt/tables/schema/table/uuid",
+                id="schema_table_unique naming",
+            ),
+            pytest.param(
+                "s3://my-data-bucket/",
+                "schema_table_unique",
+                None,
+                None,
+                False,
+                "s3://my-data-bucket/schema/table/uuid",
+                id="data_dir set",
+            ),
+            pytest.param(
+                "s3://my-data-bucket/",
+                "schema_table_unique",
+                None,
+                "s3://path/to/external/",
+                False,
+                "s3://path/to/external",
+                id="external_location set and not temporary",
+            ),
+            pytest.param(
+                "s3://my-data-bucket/",
+                "schema_table_unique",
+                None,
+                "s3://path/to/external/",
+                True,
+                "s3://my-data-bucket/schema/table/uuid",
+                id="external_location set and temporary",
+            ),
+            pytest.param(
+                None,
+                "schema_table_unique",
+                "other_table",
+                None,
+                False,
+                "s3://my-bucket/test-dbt/tables/schema/other_table/uuid",
+                id="s3_path_table_part set",
+            ),
+        ),
+    )
+    @patch("dbt.adapters.athena.impl.uuid4", return_value="uuid")
+    def test_s3_table_location(
+        self, _, s3_data_dir, s3_data_naming, external_location, s3_path_table_part, is_temporary_table, expected
+    ):
         self.adapter.acquire_connection("dummy")
-        table_name = "my_table"
-        self.mock_aws_service.create_table(table_name)
-        schema_relation = self.adapter.Relation.create(
-            database=DATA_CATALOG_NAME,
-            schema=DATABASE_NAME,
-            identifier=table_name,
+        assert expected == self.adapter.s3_table_location(
+            s3_data_dir, s3_data_naming, "schema", "table", s3_path_table_part, external_location, is_temporary_table
         )
-        self.adapter.persist_docs_to_glue(
-            schema_relation,
-            {
-                "description": """
-                        A table with str, 123, &^% \" and '
-
-                          and an other paragraph.
-                    """,
-                "columns": {
-                    "id": {
-                        "description": """
-                        A column with str, 123, &^% \" and '
 
-                          and an other paragraph.
-                    """,
-                    }
-                },
-            },
-            True,
-            True,
-        )
-        glue = boto3.client("glue", region_name=AWS_REGION)
-        table = glue.get_table(DatabaseName=DATABASE_NAME, Name=table_name).get("Table")
-        assert table["Description"] == "A table with str, 123, &^% \" and ' and an other paragraph."
-        assert table["Parameters"]["comment"] == "A table with str, 123, &^% \" and ' and an other paragraph."
-        col_id = [col for col in table["StorageDescriptor"]["Columns"] if col["Name"] == "id"][0]
-        assert col_id["Comment"] == "A column with str, 123, &^% \" and ' and an other paragraph."
-
-    @mock_athena
-    @mock_glue
-    def test_list_schemas(self):
-        self.mock_aws_service.create_data_catalog()
-        self.mock_aws_service.create_database(name="foo")
-        self.mock_aws_service.create_database(name="bar")
-        self.mock_aws_service.create_database(name="quux")
+    def test_s3_table_location_exc(self):
         self.adapter.acquire_connection("dummy")
-        res = self.adapter.list_schemas("")
-        assert sorted(res) == ["bar", "foo", "quux"]
+        with pytest.raises(ValueError) as exc:
+            self.adapter.s3_table_location(None, "other", "schema", "table")
+        assert exc.value.__str__() == "Unknown value for s3_data_naming: other"
 
-    @mock_athena
-    @mock_glue
-    def test_get_columns_in_relation(self):
-        self.mock_aws_service.create_data_catalog()
-        self.mock_aws_service.create_database()
-        self.mock_aws_service.create_table("tbl_name")
-        self.adapter.acquire_connection("dummy")
-        columns = self.adapter.get_columns_in_relation(
-            self.adapter.Relation.create(
-                database=DATA_CATALOG_NAME,
-                schema=DATABASE_NAME,
-                identifier="tbl_name",
-            )
-        )
-        assert columns == [
-            AthenaColumn(column="id", dtype="string", table_type=TableType.TABLE),
-            AthenaColumn(column="country", dtype="string", table_type=TableType.TABLE),
-            AthenaColumn(column="dt", dtype="date", table_type=TableType.TABLE),
-        ]
-
-    @mock_athena
-    @mock_glue
-    def test_get_columns_in_relation_not_found_table(self):
-        self.mock_aws_service.create_data_catalog()
-        self.mock_aws_service.create_database()
-        self.adapter.acquire_connection("dummy")
-        columns = self.adapter.get_columns_in_relation(
-            self.adapter.Relation.create(
-                database=DATA_CATALOG_NAME,
-                schema=DATABASE_NAME,
-                identifier="tbl_name",
-            )
-        )
-        assert columns == []
+    @patch("dbt.adapters.athena.impl.SQLAdapter.quote_seed_column")
+    def test_quote_seed_column(self, parent_quote_seed_column):
+        self.adapter.quote_seed_column("col", None)
+        parent_quote_seed_column.assert_called_once_with("col", False)
 
-    @mock_athena
-    @mock_glue
-    def test_delete_from_glue_catalog(self):
-        self.mock_aws_service.create_data_catalog()
-        self.mock_aws_service.create_database()
-        self.mock_aws_service.create_table("tbl_name")
-        self.adapter.acquire_connection("dummy")
-        relation = self.adapter.Relation.create(database=DATA_CATALOG_NAME, schema=DATABASE_NAME, identifier="tbl_name")
-        self.adapter.delete_from_glue_catalog(relation)
-        glue = boto3.client("glue", region_name=AWS_REGION)
-        tables_list = glue.get_tables(DatabaseName=DATABASE_NAME).get("TableList")
-        assert tables_list == []
-
-    @mock_athena
-    @mock_glue
-    def test_delete_from_glue_catalog_not_found_table(self, dbt_debug_caplog):
-        self.mock_aws_service.create_data_catalog()
-        self.mock_aws_service.create_database()
-        self.mock_aws_service.create_table("tbl_name")
-        self.adapter.acquire_connection("dummy")
-        relation = self.adapter.Relation.create(
-            database=DATA_CATALOG_NAME, schema=DATABASE_NAME, identifier="tbl_does_not_exist"
+    @pytest.mark.parametrize(
+        "s3_path,expected",
+        [
+            ("s3://my-bucket/test-dbt/tables/schema/table", ("my-bucket", "test-dbt/tables/schema/table/")),
+            ("s3://my-bucket/test-dbt/tables/schema/table/", ("my-bucket", "test-dbt/tables/schema/table/")),
+        ],
+    )
+    def test_parse_s3_path(self, s3_path, expected):
+        assert self.adapter._parse_s3_path(s3_path) == expected
+
+    @pytest.mark.parametrize(
+        "configuration,expected",
+        [
+            pytest.param(
+                {
+                    "ResultConfiguration": {"OutputLocation": "s3://pre-configured-output-location/"},
+                    "EnforceWorkGroupConfiguration": True,
+                },
+                True,
+                id="enforced",
+            ),
+            pytest.param({"EnforceWorkGroupConfiguration": True}, False, id="no location"),
+            pytest.param(
+                {
+                    "ResultConfiguration": {"OutputLocation": "s3://pre-configured-output-location/"},
+                    "EnforceWorkGroupConfiguration": False,
+                },
+                False,
+                id="not enforced",
+            ),
+        ],
+    )
+    def test_get_work_group_output_location(self, athena_client, configuration, expected):
+        stubber = Stubber(athena_client)
+        stubber.add_response(
+            "get_work_group",
+            {"WorkGroup": {"Name": ATHENA_WORKGROUP, "Configuration": configuration}},
+            {"WorkGroup": ATHENA_WORKGROUP},
         )
-        delete_table = self.adapter.delete_from_glue_catalog(relation)
-        assert delete_table is None
-        error_msg = f"Table {relation.render()} does not exist and will not be deleted, ignoring"
-        assert error_msg in dbt_debug_caplog.getvalue()
+        with mock.patch.object(self.adapter.connections, "get_thread_connection") as get_thread_connection, stubber:
+            get_thread_connection.return_value.credentials.work_group = ATHENA_WORKGROUP
+            get_thread_connection.return_value.handle.session.client.return_value = athena_client
+            assert self.adapter.is_work_group_output_location_enforced() is expected
+        stubber.assert_no_pending_responses()
 
     @pytest.mark.parametrize(
         "response,database,table,columns,lf_tags,expected",
@@ -1147,20 +867,17 @@ class TestAthenaAdapter:
         assert self.adapter._is_current_column(column) == expected
 
 
+@pytest.fixture(scope="module")
+def filter_table():
+    return agate.Table(FILTER_TABLE_ROWS, FILTER_TABLE_COLUMN_NAMES, agate_helper.DEFAULT_TYPE_TESTER)
+
+
 class TestAthenaFilterCatalog:
-    def test__catalog_filter_table(self):
+    def test__catalog_filter_table(self, filter_table):
         manifest = mock.MagicMock()
         manifest.get_used_schemas.return_value = [["a", "B"], ["a", "1234"]]
-        column_names = ["table_name", "table_database", "table_schema", "something"]
-        rows = [
-            ["foo", "a", "b", "1234"],  # include
-            ["foo", "a", "1234", "1234"],  # include, w/ table schema as str
-            ["foo", "c", "B", "1234"],  # skip
-            ["1234", "A", "B", "1234"],  # include, w/ table name as str
-        ]
-        table = agate.Table(rows, column_names, agate_helper.DEFAULT_TYPE_TESTER)
-
-        result = AthenaAdapter._catalog_filter_table(table, manifest)
+
+        result = AthenaAdapter._catalog_filter_table(filter_table, manifest)
         assert len(result) == 3
         for row in result.rows:
             assert isinstance(row["table_schema"], str)
@@ -1170,57 +887,67 @@ class TestAthenaFilterCatalog:
 
 
 class TestAthenaAdapterConversions(TestAdapterConversions):
-    def test_convert_text_type(self):
-        rows = [
-            ["", "a1", "stringval1"],
-            ["", "a2", "stringvalasdfasdfasdfa"],
-            ["", "a3", "stringval3"],
-        ]
-        agate_table = self._make_table_of(rows, agate.Text)
-        expected = ["string", "string", "string"]
-        for col_idx, expect in enumerate(expected):
-            assert AthenaAdapter.convert_text_type(agate_table, col_idx) == expect
-
-    def test_convert_number_type(self):
-        rows = [
-            ["", "23.98", "-1"],
-            ["", "12.78", "-2"],
-            ["", "79.41", "-3"],
-        ]
-        agate_table = self._make_table_of(rows, agate.Number)
-        expected = ["integer", "double", "integer"]
-        for col_idx, expect in enumerate(expected):
-            assert AthenaAdapter.convert_number_type(agate_table, col_idx) == expect
-
-    def test_convert_boolean_type(self):
-        rows = [
-            ["", "false", "true"],
-            ["", "false", "false"],
-            ["", "false", "true"],
-        ]
-        agate_table = self._make_table_of(rows, agate.Boolean)
-        expected = ["boolean", "boolean", "boolean"]
-        for col_idx, expect in enumerate(expected):
-            assert AthenaAdapter.convert_boolean_type(agate_table, col_idx) == expect
-
-    def test_convert_datetime_type(self):
-        rows = [
-            ["", "20190101T01:01:01Z", "2019-01-01 01:01:01"],
-            ["", "20190102T01:01:01Z", "2019-01-01 01:01:01"],
-            ["", "20190103T01:01:01Z", "2019-01-01 01:01:01"],
-        ]
-        agate_table = self._make_table_of(rows, [agate.DateTime, agate_helper.ISODateTime, agate.DateTime])
-        expected = ["timestamp", "timestamp", "timestamp"]
-        for col_idx, expect in enumerate(expected):
-            assert AthenaAdapter.convert_datetime_type(agate_table, col_idx) == expect
-
-    def test_convert_date_type(self):
-        rows = [
-            ["", "2019-01-01", "2019-01-04"],
-            ["", "2019-01-02", "2019-01-04"],
-            ["", "2019-01-03", "2019-01-04"],
-        ]
-        agate_table = self._make_table_of(rows, agate.Date)
-        expected = ["date", "date", "date"]
+    @pytest.mark.parametrize(
+        "converter,rows,col_types,expected",
+        [
+            pytest.param(
+                AthenaAdapter.convert_text_type,
+                [
+                    ["", "a1", "stringval1"],
+                    ["", "a2", "stringvalasdfasdfasdfa"],
+                    ["", "a3", "stringval3"],
+                ],
+                agate.Text,
+                ["string", "string", "string"],
+                id="text",
+            ),
+            pytest.param(
+                AthenaAdapter.convert_number_type,
+                [
+                    ["", "23.98", "-1"],
+                    ["", "12.78", "-2"],
+                    ["", "79.41", "-3"],
+                ],
+                agate.Number,
+                ["integer", "double", "integer"],
+                id="number",
+            ),
+            pytest.param(
+                AthenaAdapter.convert_boolean_type,
+                [
+                    ["", "false", "true"],
+                    ["", "false", "false"],
+                    ["", "false", "true"],
+                ],
+                agate.Boolean,
+                ["boolean", "boolean", "boolean"],
+                id="boolean",
+            ),
+            pytest.param(
+                AthenaAdapter.convert_datetime_type,
+                [
+                    ["", "20190101T01:01:01Z", "2019-01-01 01:01:01"],
+                    ["", "20190102T01:01:01Z", "2019-01-01 01:01:01"],
+                    ["", "20190103T01:01:01Z", "2019-01-01 01:01:01"],
+                ],
+                [agate.DateTime, agate_helper.ISODateTime, agate.DateTime],
+                ["timestamp", "timestamp", "timestamp"],
+                id="datetime",
+            ),
+            pytest.param(
+                AthenaAdapter.convert_date_type,
+                [
+                    ["", "2019-01-01", "2019-01-04"],
+                    ["", "2019-01-02", "2019-01-04"],
+                    ["", "2019-01-03", "2019-01-04"],
+                ],
+                agate.Date,
+                ["date", "date", "date"],
+                id="date",
+            ),
+        ],
+    )
+    def test_convert_type(self, converter, rows, col_types, expected):
+        agate_table = self._make_table_of(rows, col_types)
         for col_idx, expect in enumerate(expected):
-            assert AthenaAdapter.convert_date_type(agate_table, col_idx) == expect
+            assert converter(agate_table, col_idx) == expect
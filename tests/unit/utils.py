@@ -1,5 +1,6 @@
 import os
 import string
+from typing import Sequence
 
 import agate
 import boto3
@@ -132,6 +133,10 @@ class TestAdapterConversions:
 
 
 class MockAWSService:
+    def __init__(self):
+        self._created_databases = []
+        self._created_tables = []
+
     def create_data_catalog(
         self, catalog_name: str = DATA_CATALOG_NAME, catalog_type: str = "GLUE", catalog_id: str = CATALOG_ID
     ):
@@ -141,6 +146,13 @@ class MockAWSService:
     def create_database(self, name: str = DATABASE_NAME, catalog_id: str = CATALOG_ID):
         glue = boto3.client("glue", region_name=AWS_REGION)
         glue.create_database(DatabaseInput={"Name": name}, CatalogId=catalog_id)
+        self._created_databases.append((name, catalog_id))
+
+    def create_databases(self, names: Sequence[str], catalog_id: str = CATALOG_ID):
+        glue = boto3.client("glue", region_name=AWS_REGION)
+        for name in names:
+            glue.create_database(DatabaseInput={"Name": name}, CatalogId=catalog_id)
+            self._created_databases.append((name, catalog_id))
 
     def create_view(self, view_name: str):
         glue = boto3.client("glue", region_name=AWS_REGION)
@@ -168,6 +180,7 @@ class MockAWSService:
                 "TableType": "VIRTUAL_VIEW",
             },
         )
+        self._created_tables.append((DATABASE_NAME, view_name))
 
     def create_table(self, table_name: str, database_name: str = DATABASE_NAME, catalog_id: str = CATALOG_ID):
         glue = boto3.client("glue", region_name=AWS_REGION)
@@ -204,6 +217,7 @@ class MockAWSService:
                 },
             },
         )
+        self._created_tables.append((database_name, table_name))
 
     def create_table_without_type(self, table_name: str, database_name: str = DATABASE_NAME):
         glue = boto3.client("glue", region_name=AWS_REGION)
@@ -232,6 +246,7 @@ class MockAWSService:
                 },
             },
         )
+        self._created_tables.append((database_name, table_name))
 
     def create_table_without_partitions(self, table_name: str):
         glue = boto3.client("glue", region_name=AWS_REGION)
@@ -266,6 +281,7 @@ class MockAWSService:
                 },
             },
         )
+        self._created_tables.append((DATABASE_NAME, table_name))
 
     def create_iceberg_table(self, table_name: str):
         glue = boto3.client("glue", region_name=AWS_REGION)
@@ -303,6 +319,7 @@ class MockAWSService:
                 },
             },
         )
+        self._created_tables.append((DATABASE_NAME, table_name))
 
     def create_table_without_table_type(self, table_name: str):
         glue = boto3.client("glue", region_name=AWS_REGION)
@@ -321,54 +338,7 @@ class MockAWSService:
                 },
             },
         )
-
-    def create_work_group_with_output_location_enforced(self, work_group_name: str):
-        athena = boto3.client("athena", region_name=AWS_REGION)
-        athena.create_work_group(
-            Name=work_group_name,
-            Configuration={
-                "ResultConfiguration": {
-                    "OutputLocation": "s3://pre-configured-output-location/",
-                },
-                "EnforceWorkGroupConfiguration": True,
-                "PublishCloudWatchMetricsEnabled": True,
-                "EngineVersion": {
-                    "SelectedEngineVersion": "Athena engine version 2",
-                    "EffectiveEngineVersion": "Athena engine version 2",
-                },
-            },
-        )
-
-    def create_work_group_with_output_location_not_enforced(self, work_group_name: str):
-        athena = boto3.client("athena", region_name=AWS_REGION)
-        athena.create_work_group(
-            Name=work_group_name,
-            Configuration={
-                "ResultConfiguration": {
-                    "OutputLocation": "s3://pre-configured-output-location/",
-                },
-                "EnforceWorkGroupConfiguration": False,
-                "PublishCloudWatchMetricsEnabled": True,
-                "EngineVersion": {
-                    "SelectedEngineVersion": "Athena engine version 2",
-                    "EffectiveEngineVersion": "Athena engine version 2",
-                },
-            },
-        )
-
-    def create_work_group_no_output_location(self, work_group_name: str):
-        athena = boto3.client("athena", region_name=AWS_REGION)
-        athena.create_work_group(
-            Name=work_group_name,
-            Configuration={
-                "EnforceWorkGroupConfiguration": True,
-                "PublishCloudWatchMetricsEnabled": True,
-                "EngineVersion": {
-                    "SelectedEngineVersion": "Athena engine version 2",
-                    "EffectiveEngineVersion": "Athena engine version 2",
-                },
-            },
-        )
+        self._created_tables.append((DATABASE_NAME, table_name))
 
     def add_data_in_table(self, table_name: str):
         s3 = boto3.client("s3", region_name=AWS_REGION)
@@ -436,7 +406,7 @@ class MockAWSService:
             DatabaseName=database, TableName=table_name, PartitionInputList=partition_input_list
         )
 
-    def add_table_version(self, database, table_name):
+    def add_table_versions(self, database, table_name, n=1):
         glue = boto3.client("glue", region_name=AWS_REGION)
         table = glue.get_table(DatabaseName=database, Name=table_name).get("Table")
         new_table_version = {
@@ -446,4 +416,27 @@ class MockAWSService:
             "TableType": table["TableType"],
             "Parameters": table["Parameters"],
         }
-        glue.update_table(DatabaseName=database, TableInput=new_table_version)
+        for _ in range(n):
+            glue.update_table(DatabaseName=database, TableInput=new_table_version)
+
+    def drop_created_glue_objects(self):
+        """Drop the Glue databases and tables created through this service since the last call."""
+        # forget the record up front, so a failing delete is not retried by every later teardown
+        created_databases, self._created_databases = self._created_databases, []
+        created_tables, self._created_tables = self._created_tables, []
+        glue = boto3.client("glue", region_name=AWS_REGION)
+        dropped_databases = {name for name, _ in created_databases}
+        for database_name, table_name in created_tables:
+            # tables of a dropped database go away with it
+            if database_name in dropped_databases:
+                continue
+            try:
+                glue.delete_table(DatabaseName=database_name, Name=table_name)
+            except glue.exceptions.EntityNotFoundException:
+                # the test itself already dropped the table
+                pass
+        for name, catalog_id in created_databases:
+            try:
+                glue.delete_database(Name=name, CatalogId=catalog_id)
+            except glue.exceptions.EntityNotFoundException:
+                pass